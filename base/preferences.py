@@ -80,6 +80,17 @@ def get_wheel():
     return ""
 
 
+def update_workplane_size(self, context):
+    from ..utilities.workplane_renderer import clear_geometry
+
+    clear_geometry()
+    if context.scene:
+        # Only the border changes, entities on the workplane stay untouched
+        for wp in context.scene.sketcher.entities.workplanes:
+            wp.dirty = True
+    theme.update(self, context)
+
+
 # Presets
 
 
@@ -158,7 +169,11 @@ class Preferences(AddonPreferences):
         name="Entity Scale", default=1.0, min=0.1, soft_max=3.0, update=theme.update
     )
     workplane_size: FloatProperty(
-        name="Workplane Size", default=0.4, soft_min=0.1, soft_max=1.0
+        name="Workplane Size",
+        default=0.4,
+        soft_min=0.1,
+        soft_max=1.0,
+        update=update_workplane_size,
     )
     gizmo_scale: FloatProperty(
         name="Icon Scale", default=15.0, min=1.0, soft_max=25.0, update=theme.update
@@ -170,6 +185,19 @@ class Preferences(AddonPreferences):
         description="Automatically align view to workplane when activating a sketch.",
         default=True,
     )
+    force_thick_lines: BoolProperty(
+        name="Always Draw Thick Lines",
+        description="Draw lines with the polyline shader even when they are "
+        "at most one pixel wide, otherwise thin lines are rasterized directly",
+        default=False,
+        update=theme.update,
+    )
+    workplane_surface_picking: BoolProperty(
+        name="Pick Workplane Surface",
+        description="Allow to select workplanes by their surface while a sketch is active, "
+        "otherwise only the border is selectable",
+        default=False,
+    )
 
     def draw(self, context):
         layout = self.layout
@@ -204,6 +232,8 @@ class Preferences(AddonPreferences):
         col = box.column(align=True)
         col.prop(self, "auto_hide_objects")
         col.prop(self, "use_align_view")
+        col.prop(self, "workplane_surface_picking")
+        col.prop(self, "force_thick_lines")
 
         col.prop(self, "entity_scale")
         col.prop(self, "workplane_size")
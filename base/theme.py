@@ -2,8 +2,11 @@ import bpy
 from bpy.props import PointerProperty, FloatVectorProperty, FloatProperty
 from bpy.types import PropertyGroup
 
+from .. import global_data
+
 
 def update(self, context):
+    global_data.color_lut = None
     for window in context.window_manager.windows:
         for area in window.screen.areas:
             if area.type != "VIEW_3D":
@@ -1,3 +1,6 @@
+import logging
+import math
+
 import bpy
 import gpu
 from bpy.types import Context, Operator
@@ -6,10 +9,20 @@ from bpy.app.handlers import persistent
 from mathutils import Vector
 
 from . import global_data
-from .utilities.preferences import use_experimental
+from .utilities.preferences import (
+    use_experimental,
+    get_prefs,
+    cache_scale,
+    clear_scale_cache,
+)
 from .utilities.constants import RenderingConstants
 from .utilities.gpu_manager import GPUResourceManager
-from .declarations import Operators
+from .utilities.workplane_renderer import WorkplaneRenderer
+from .declarations import Operators, WorkSpaceTools
+from .model.base_entity import SlvsGenericEntity, flush_pending_dirty
+from .model.workplane import SlvsWorkplane
+
+logger = logging.getLogger(__name__)
 
 
 # Performance cache for expensive calculations
@@ -107,18 +120,11 @@ def get_entity_distance_from_camera(entity, context, camera_location=None):
             # Fallback: return a large distance so entity is drawn first (behind others)
             return float('inf')
 
-        # Calculate distance
-        if hasattr(entity_location, '__len__') and len(entity_location) >= 3:
-            entity_pos = Vector(entity_location[:3])
-        else:
-            entity_pos = Vector(entity_location)
-
-        return (camera_location - entity_pos).length
+        # Calculate distance on plain floats, mismatching dimensions raise a ValueError
+        return math.dist(camera_location, entity_location[:3])
 
     except (AttributeError, ValueError, TypeError) as e:
         # Log specific errors for debugging while gracefully handling them
-        import logging
-        logger = logging.getLogger(__name__)
         logger.debug(f"Distance calculation failed for entity {getattr(entity, '__class__', type(entity)).__name__}: {e}")
         # Return large distance on error so entity is drawn first
         return float('inf')
@@ -173,9 +179,18 @@ def draw_selection_buffer(context: Context):
         # Sort entities by modified distance (farthest first, but workplanes get priority)
         entities.sort(key=get_sorting_key, reverse=True)
 
+        # Workplane surfaces are only pickable outside of a sketch or when enabled
+        full_workplanes = (
+            not context.scene.sketcher.active_sketch
+            or get_prefs().workplane_surface_picking
+        )
+
         # Draw entities in distance-sorted order
         for e in entities:
-            e.draw_id(context)
+            if isinstance(e, SlvsWorkplane):
+                e.draw_id(context, full=full_workplanes)
+            else:
+                e.draw_id(context)
 
         # Restore default depth state
         gpu.state.depth_test_set('NONE')
@@ -197,6 +212,7 @@ def update_elements(context: Context, force: bool = False):
     """
     Update entity geometry batches when needed.
     """
+    flush_pending_dirty(context.scene)
     entities = list(context.scene.sketcher.entities.all)
     entities_updated = False
 
@@ -214,9 +230,46 @@ def update_elements(context: Context, force: bool = False):
 
 
 def draw_elements(context: Context):
+    # Entities that use the generic draw are drawn in runs sharing a bound
+    # shader instead of binding and unbinding it for every single entity
+    bound = None
+
     for entity in reversed(list(context.scene.sketcher.entities.all)):
-        if hasattr(entity, "draw"):
+        if not hasattr(entity, "draw"):
+            continue
+
+        # Queued workplane surfaces are drawn once the run of workplanes ends,
+        # entities that follow are drawn on top of them like before. No shader
+        # is bound here as drawing a workplane ends any run of shared shaders.
+        if WorkplaneRenderer.has_pending() and not isinstance(entity, SlvsWorkplane):
+            WorkplaneRenderer.flush()
+
+        cls = type(entity)
+        if cls.draw is not SlvsGenericEntity.draw:
+            if bound is not None:
+                gpu.shader.unbind()
+                SlvsGenericEntity.restore_opengl_defaults()
+                bound = None
             entity.draw(context)
+            continue
+
+        if not entity.is_visible(context) or not entity._batch:
+            continue
+
+        shader = entity._shader
+        polyline = entity._uses_polyline_shader
+        key = (shader, polyline)
+        if key != bound:
+            cls.bind_draw_shader(shader, context, polyline)
+            bound = key
+        entity.draw_batch(context, shader, polyline)
+
+    if bound is not None:
+        gpu.shader.unbind()
+        SlvsGenericEntity.restore_opengl_defaults()
+
+    # Draw the surfaces of workplanes that came last
+    WorkplaneRenderer.flush()
 
 
 def draw_cb():
@@ -230,8 +283,12 @@ def draw_cb():
         _perf_cache._initialized_for_scene = True
 
     force = use_experimental("force_redraw", True)
-    update_elements(context, force=force)
-    draw_elements(context)
+    cache_scale()
+    try:
+        update_elements(context, force=force)
+        draw_elements(context)
+    finally:
+        clear_scale_cache()
 
     # Restore original behavior: mark for redraw every frame
     # This ensures selection works correctly
@@ -285,22 +342,20 @@ def load_handler_reset_cache(dummy):
         delattr(_perf_cache, '_initialized_for_scene')
     # Force selection buffer redraw
     global_data.redraw_selection_buffer = True
+    global_data.reverse_deps = None
+    global_data.pending_dirty.clear()
 
     # Clean up GPU resources on file load to prevent accumulation
     try:
-        import bpy
         # Use a dummy context for cleanup - should be safe during file load
         context = bpy.context
         GPUResourceManager.force_cleanup_all(context)
     except Exception as e:
-        import logging
-        logger = logging.getLogger(__name__)
         logger.debug(f"GPU cleanup on file load failed: {e}")
 
     # Ensure Select tool is active to enable click selection - use timer for deferred activation
     def activate_select_tool():
         """Deferred function to activate select tool after file load completes."""
-        from .declarations import WorkSpaceTools
         try:
             # Check if we're in the right context (3D viewport)
             for area in bpy.context.screen.areas:
@@ -310,8 +365,6 @@ def load_handler_reset_cache(dummy):
                     break
         except Exception as e:
             # Log but don't fail if tool activation fails
-            import logging
-            logger = logging.getLogger(__name__)
             logger.debug(f"Could not activate Select tool on file load: {e}")
         return None  # Don't repeat the timer
 
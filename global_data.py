@@ -9,19 +9,37 @@ PYPATH = sys.executable
 
 entities = {}
 batches = {}
+# Geometry key and shared flag of each batch, allows to reuse unchanged batches
+# and to release batches shared through the gpu_pool, see _update_batch()
+batch_keys = {}
 
 offscreen = None
 redraw_selection_buffer = False
 
 hover = -1
 ignore_list = []
-selected = []
+
+# Indices of selected entities, a dict is used as an insertion ordered set
+# to get constant time lookups while keeping the selection order
+selected = {}
 
 # Allows to highlight a constraint gizmo,
 # Value gets unset in the preselection gizmo
 highlight_constraint = None
 
-highlight_entities = []
+# Indices of entities that should be highlighted, e.g. members of a constraint
+highlight_entities = set()
+
+# Maps an entity index to the indices of the entities depending on it,
+# built lazily for the entities collection stored in reverse_deps_owner
+reverse_deps = None
+reverse_deps_owner = None
+
+# Entity indices queued by tag_update per scene pointer, see flush_pending_dirty
+pending_dirty = {}
+
+# Entity colors indexed by state bits, built lazily from the theme
+color_lut = None
 
 Z_AXIS = Vector((0, 0, 1))
 
@@ -46,9 +64,14 @@ def cleanup_unused_batches(context):
         if index not in valid_indices:
             invalid_indices.append(index)
 
+    from .utilities import gpu_pool
+
     for index in invalid_indices:
         # GPU batches are automatically cleaned up by Blender when no longer referenced
         del batches[index]
+        key = batch_keys.pop(index, None)
+        if key is not None and key[1]:
+            gpu_pool.release(key[0])
 
     if invalid_indices:
         print(f"Cleaned up {len(invalid_indices)} unused GPU batches")
@@ -63,9 +63,11 @@ def unregister_handlers():
 
 def _setup_builtin_handlers():
     from .versioning import write_addon_version, do_versioning
+    from .model.base_entity import flush_pending_dirty_handler
 
     add_builtin_handler("version_update", do_versioning)
     add_builtin_handler("save_pre", write_addon_version)
+    add_builtin_handler("depsgraph_update_post", flush_pending_dirty_handler)
 
 
 def register():
@@ -4,7 +4,6 @@ from typing import List
 import bpy
 from bpy.types import PropertyGroup, Context
 from bpy.props import BoolProperty
-from gpu_extras.batch import batch_for_shader
 import math
 from mathutils import Vector, Matrix
 from mathutils.geometry import intersect_line_sphere_2d, intersect_sphere_sphere_2d
@@ -19,7 +18,7 @@ from .utilities import slvs_entity_pointer
 from .constants import CURVE_RESOLUTION
 from ..utilities.constants import HALF_TURN, FULL_TURN, QUARTER_TURN
 from ..utilities.math import range_2pi, pol2cart
-from ..utilities.draw import coords_arc_2d
+from ..utilities.draw import coords_arc_2d, transform_coords_2d
 from .utilities import (
     get_connection_point,
     get_bezier_curve_midpoint_positions,
@@ -96,34 +95,26 @@ class SlvsArc(Entity2D, PropertyGroup):
 
             if self.is_dashed():
                 # Create dashed arc geometry
-                coords = self._create_dashed_arc_coords(radius, angle, offset)
-                # Transform coordinates
-                mat_local = Matrix.Translation(self.ct.co.to_3d())
-                mat = self.wp.matrix_basis @ mat_local
-                coords = [(mat @ Vector((*co, 0)))[:] for co in coords]
+                coords, indices = self._create_dashed_arc_coords(ct, radius, angle, offset)
+                coords = transform_coords_2d(coords, self.wp.matrix_basis)
 
                 # Use LINES for dashed arcs
-                kwargs = {"pos": coords}
-                self._batch = batch_for_shader(self._shader, "LINES", kwargs)
+                self._update_batch(self._shader, "LINES", coords, indices=indices)
             else:
                 # Standard solid arc
                 # TODO: resolution should depend on segment length?!
                 segments = round(CURVE_RESOLUTION * (angle / FULL_TURN))
-                coords = coords_arc_2d(0, 0, radius, segments, angle=angle, offset=offset)
+                coords = coords_arc_2d(*ct, radius, segments, angle=angle, offset=offset)
+                coords = transform_coords_2d(coords, self.wp.matrix_basis)
 
-                mat_local = Matrix.Translation(self.ct.co.to_3d())
-                mat = self.wp.matrix_basis @ mat_local
-                coords = [(mat @ Vector((*co, 0)))[:] for co in coords]
-
-                kwargs = {"pos": coords}
-                self._batch = batch_for_shader(self._shader, "LINE_STRIP", kwargs)
+                self._update_batch(self._shader, "LINE_STRIP", coords)
 
         self.is_dirty = False
 
-    def _create_dashed_arc_coords(self, radius, total_angle, start_offset):
+    def _create_dashed_arc_coords(self, center, radius, total_angle, start_offset):
         """Create coordinates for a dashed arc with gaps."""
         return DashedLineRenderer.create_dashed_arc_coords(
-            None, radius, total_angle, start_offset,
+            center, radius, total_angle, start_offset,
             max(3, int(CURVE_RESOLUTION * 0.1))
         )
 
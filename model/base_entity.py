@@ -1,6 +1,7 @@
 import logging
-from typing import List
+from typing import Dict, List, Tuple
 
+import bpy
 import gpu
 from bpy.props import IntProperty, StringProperty, BoolProperty
 from bpy.types import Context
@@ -8,6 +9,8 @@ from bpy.types import Context
 from .. import global_data
 from ..utilities import preferences
 from ..utilities.constants import RenderingConstants
+from ..utilities import gpu_pool
+from ..utilities.draw import batch_from_arrays, pack_coords
 from ..utilities.gpu_manager import ShaderManager
 from ..shaders import Shaders
 from ..declarations import Operators
@@ -18,14 +21,133 @@ from ..utilities.solver import update_system_cb
 
 logger = logging.getLogger(__name__)
 
+# Shaders resolved per entity class, cleared together with the ShaderManager cache
+_class_shaders = ShaderManager.register_dependent_cache({})
+
+
+def invalidate_reverse_deps():
+    """Force the reverse dependency map to be rebuilt, call when entity pointers change"""
+    global_data.reverse_deps = None
+
+
+def _get_reverse_deps(entities) -> Dict[int, List[int]]:
+    owner = entities.as_pointer()
+    if global_data.reverse_deps is None or global_data.reverse_deps_owner != owner:
+        reverse_deps = {}
+        for e in entities.all:
+            for dep in e.dependencies():
+                if dep is None:
+                    continue
+                reverse_deps.setdefault(dep.slvs_index, []).append(e.slvs_index)
+        global_data.reverse_deps = reverse_deps
+        global_data.reverse_deps_owner = owner
+    return global_data.reverse_deps
+
+
+def _propagate_dirty(entity):
+    """Mark all entities which directly or indirectly depend on entity as dirty"""
+    entities = entity.id_data.sketcher.entities
+    reverse_deps = _get_reverse_deps(entities)
+    _mark_dirty(entities, reverse_deps.get(entity.slvs_index, ()), reverse_deps)
+
+
+def _mark_dirty(entities, indices, reverse_deps):
+    """Mark the given entities and their dependents as dirty"""
+    stack = list(indices)
+    visited = set()
+    while stack:
+        index = stack.pop()
+        if index in visited:
+            continue
+        visited.add(index)
+
+        entity = entities.get(index)
+        if entity is None:
+            continue
+        entity.dirty = True
+        stack.extend(reverse_deps.get(index, ()))
+
+
+def _resolve_color(ts, bits: int):
+    active = bits & 0b10000
+    highlight = bits & 0b01000
+    selected = bits & 0b00100
+    fixed = bits & 0b00010
+    origin = bits & 0b00001
+
+    if not active:
+        if highlight:
+            return ts.entity.highlight
+        if selected:
+            return ts.entity.inactive_selected
+        return ts.entity.inactive
+
+    elif selected:
+        if highlight:
+            return ts.entity.selected_highlight
+        return ts.entity.selected
+    elif highlight:
+        return ts.entity.highlight
+
+    if fixed and not origin:
+        return ts.entity.fixed
+    return ts.entity.default
+
+
+def _get_color_lut() -> Tuple[Tuple[float, ...], ...]:
+    """Entity colors for every combination of the
+    active, highlight, selected, fixed and origin states"""
+    lut = global_data.color_lut
+    if lut is None:
+        ts = get_prefs().theme_settings
+        lut = global_data.color_lut = tuple(
+            tuple(_resolve_color(ts, bits)) for bits in range(32)
+        )
+    return lut
+
+
+_flushing = False
+
+
+def flush_pending_dirty(scene):
+    """Mark entities queued by tag_update and their dependents as dirty at once"""
+    global _flushing
+    if _flushing:
+        return
+
+    pending = global_data.pending_dirty.pop(scene.as_pointer(), None)
+    if not pending:
+        return
+
+    _flushing = True
+    try:
+        entities = scene.sketcher.entities
+        _mark_dirty(entities, pending, _get_reverse_deps(entities))
+    finally:
+        _flushing = False
+
+
+def flush_pending_dirty_handler(scene, _depsgraph=None):
+    if not global_data.pending_dirty:
+        return
+    flush_pending_dirty(scene)
+
+    # Drop entries of scenes that have been removed in the meantime
+    scenes = {s.as_pointer() for s in bpy.data.scenes}
+    for pointer in [p for p in global_data.pending_dirty if p not in scenes]:
+        del global_data.pending_dirty[pointer]
+
 
 def tag_update(self, _context=None):
     # context argument ignored
-    if not self.is_dirty:
-        self.is_dirty = True
-        # Invalidate dependency cache when entity changes
-        if hasattr(self, '_dependency_cache'):
-            del self._dependency_cache
+    # Queue the entity, updates from bulk operations like solving get
+    # coalesced and dirty state is only propagated once per entity
+    global_data.pending_dirty.setdefault(self.id_data.as_pointer(), set()).add(
+        self.slvs_index
+    )
+    # Invalidate dependency cache when entity changes
+    if hasattr(self, '_dependency_cache'):
+        del self._dependency_cache
 
 
 class SlvsGenericEntity:
@@ -56,20 +178,16 @@ class SlvsGenericEntity:
 
     @property
     def is_dirty(self) -> bool:
-        if self.dirty:
-            return True
-
-        if not hasattr(self, "dependencies"):
-            return False
-        deps = self.dependencies()
-        for e in deps:
-            # NOTE: might has to ckech through deps recursively -> e.is_dirty
-            if e.dirty:
-                return True
-        return False
+        # Dependents get marked when a dependency becomes dirty, see _propagate_dirty.
+        # Entities queued by tag_update are only marked once flush_pending_dirty ran
+        return self.dirty
 
     @is_dirty.setter
     def is_dirty(self, value: bool):
+        if value and not self.dirty:
+            self.dirty = True
+            _propagate_dirty(self)
+            return
         self.dirty = value
 
     @property
@@ -80,19 +198,40 @@ class SlvsGenericEntity:
         Uses geometry-based rendering approach for all backends:
         - Points: Cached UNIFORM_COLOR shader (for triangle-based point geometry)
         - Lines: Cached POLYLINE_UNIFORM_COLOR shader (for proper line width support)
+        - Thin lines: Cached UNIFORM_COLOR shader, lines that are at most one pixel
+          wide are left to the hardware rasterizer unless thick lines are forced
 
         Returns:
             GPUShader: Appropriate cached shader for entity type
         """
+        key = (type(self), self._uses_polyline_shader)
+        shader = _class_shaders.get(key)
+        if shader is None:
+            if key[1]:
+                # For thicker lines use cached POLYLINE_UNIFORM_COLOR for proper line width
+                shader = ShaderManager.get_polyline_shader()
+            else:
+                shader = ShaderManager.get_uniform_color_shader()
+            _class_shaders[key] = shader
+        return shader
+
+    @property
+    def _uses_polyline_shader(self) -> bool:
+        """Whether the entity is drawn with the polyline shader, see _shader"""
         if self.is_point():
-            return ShaderManager.get_uniform_color_shader()
-        # For lines, always use cached POLYLINE_UNIFORM_COLOR for proper line width
-        return ShaderManager.get_polyline_shader()
+            return False
+        return self.line_width > 1.0 or get_prefs().force_thick_lines
 
     @property
     def _id_shader(self):
         """Get the appropriate cached ID shader for selection rendering."""
-        return ShaderManager.get_id_shader(is_point=self.is_point())
+        cls = type(self)
+        shader = _class_shaders.get(cls)
+        if shader is None:
+            shader = _class_shaders[cls] = ShaderManager.get_id_shader(
+                is_point=cls.is_point()
+            )
+        return shader
 
     @property
     def point_size(self):
@@ -138,6 +277,30 @@ class SlvsGenericEntity:
     def _batch(self, value):
         global_data.batches[self.slvs_index] = value
 
+    def _update_batch(self, shader, batch_type, coords, indices=None, shared=False):
+        """Create the entity's batch from the given geometry, the existing batch
+        is kept when it was created from identical geometry.
+
+        Pass shared for geometry that repeats between entities, the batch is
+        then taken from the gpu_pool instead of being owned by the entity.
+        """
+        coords = pack_coords(coords)
+        key = (gpu_pool.make_key(shader, batch_type, coords, indices), shared)
+
+        index = self.slvs_index
+        old_key = global_data.batch_keys.get(index)
+        if old_key == key and self._batch is not None:
+            return
+
+        if shared:
+            self._batch = gpu_pool.acquire(shader, batch_type, coords, indices, key=key[0])
+        else:
+            self._batch = batch_from_arrays(shader, batch_type, coords, indices)
+        global_data.batch_keys[index] = key
+
+        if old_key is not None and old_key[1]:
+            gpu_pool.release(old_key[0])
+
     # NOTE: hover and select could be replaced by actual props with getter and setter funcs
     # selected: BoolProperty(name="Selected")
 
@@ -158,14 +321,10 @@ class SlvsGenericEntity:
 
     @selected.setter
     def selected(self, value):
-        slvs_index = self.slvs_index
-        list = global_data.selected
-        if slvs_index in list:
-            i = list.index(slvs_index)
-            if not value:
-                list.pop(i)
-        elif value:
-            list.append(slvs_index)
+        if value:
+            global_data.selected.setdefault(self.slvs_index, None)
+        else:
+            global_data.selected.pop(self.slvs_index, None)
 
     def is_active(self, active_sketch):
         if hasattr(self, "sketch"):
@@ -192,33 +351,17 @@ class SlvsGenericEntity:
         return self.is_active(active_sketch)
 
     def is_highlight(self):
-        return self.hover or self in global_data.highlight_entities
+        return self.hover or self.slvs_index in global_data.highlight_entities
 
     def color(self, context: Context):
-        prefs = get_prefs()
-        ts = prefs.theme_settings
-        active = self.is_active(context.scene.sketcher.active_sketch)
-        highlight = self.is_highlight()
-        fixed = self.fixed
-        origin = self.origin
-
-        if not active:
-            if highlight:
-                return ts.entity.highlight
-            if self.selected:
-                return ts.entity.inactive_selected
-            return ts.entity.inactive
-
-        elif self.selected:
-            if highlight:
-                return ts.entity.selected_highlight
-            return ts.entity.selected
-        elif highlight:
-            return ts.entity.highlight
-
-        if fixed and not origin:
-            return ts.entity.fixed
-        return ts.entity.default
+        bits = (
+            self.is_active(context.scene.sketcher.active_sketch) << 4
+            | self.is_highlight() << 3
+            | self.selected << 2
+            | self.fixed << 1
+            | self.origin
+        )
+        return _get_color_lut()[bits]
 
     @staticmethod
     def restore_opengl_defaults():
@@ -255,34 +398,56 @@ class SlvsGenericEntity:
             return
 
         shader = self._shader
+        polyline = self._uses_polyline_shader
+        self.bind_draw_shader(shader, context, polyline)
+        self.draw_batch(context, shader, polyline)
+        gpu.shader.unbind()
+        self.restore_opengl_defaults()
+
+    @classmethod
+    def bind_draw_shader(cls, shader, context: Context, polyline: bool = False):
+        """
+        Bind the entity shader and set the uniforms that are shared by all
+        entities drawn with it, see draw_batch(). Pass polyline when the
+        shader is the polyline shader, see _uses_polyline_shader.
+        """
         shader.bind()
         gpu.state.blend_set("ALPHA")
 
-        col = self.color(context)
-        shader.uniform_float("color", col)
+        if not polyline:
+            # Points are already rendered as triangles and thin lines are
+            # rasterized directly, no additional setup needed
+            return
 
-        if self.is_point():
-            # Points are already rendered as triangles, no additional setup needed
-            pass
-        else:
-            # For lines, use POLYLINE_UNIFORM_COLOR with proper uniforms
+        # For lines, use POLYLINE_UNIFORM_COLOR with proper uniforms
+        try:
+            # Try viewportSize as tuple first, then as separate components
+            try:
+                shader.uniform_float("viewportSize", (context.region.width, context.region.height))
+            except (AttributeError, ValueError) as e:
+                logger.debug(f"viewportSize tuple failed, trying components: {e}")
+                shader.uniform_float("viewportSize[0]", float(context.region.width))
+                shader.uniform_float("viewportSize[1]", float(context.region.height))
+        except (AttributeError, ValueError, TypeError) as e:
+            logger.debug(f"Viewport uniform setup failed: {e}")
+
+    def draw_batch(self, context: Context, shader, polyline: bool = False):
+        """
+        Draw the entity's batch with an already bound shader, only the
+        uniforms that differ between entities are set.
+        """
+        shader.uniform_float("color", self.color(context))
+
+        # Thin lines are drawn with the default line width of one pixel
+        if polyline:
             try:
                 shader.uniform_float("lineWidth", self.line_width)
-                # Try viewportSize as tuple first, then as separate components
-                try:
-                    shader.uniform_float("viewportSize", (context.region.width, context.region.height))
-                except (AttributeError, ValueError) as e:
-                    logger.debug(f"viewportSize tuple failed, trying components: {e}")
-                    shader.uniform_float("viewportSize[0]", float(context.region.width))
-                    shader.uniform_float("viewportSize[1]", float(context.region.height))
             except (AttributeError, ValueError, TypeError) as e:
                 # Fall back to OpenGL state if uniforms fail
                 logger.debug(f"Line uniform setup failed, falling back to OpenGL state: {e}")
                 gpu.state.line_width_set(self.line_width)
 
-        batch.draw(shader)
-        gpu.shader.unbind()
-        self.restore_opengl_defaults()
+        self._batch.draw(shader)
 
     def draw_id(self, context):
         # Note: Design Question, should it be possible to select elements that are not active?!
@@ -325,9 +490,7 @@ class SlvsGenericEntity:
                 )
                 setattr(self, name, index_new)
 
-        for prop_name in dir(self):
-            if not prop_name.endswith("_i"):
-                continue
+        for prop_name in self._pointer_props():
             _update(prop_name)
 
         if hasattr(self, "target_object") and self.target_object:
@@ -335,6 +498,20 @@ class SlvsGenericEntity:
             if ob.sketch_index == index_old:
                 ob.sketch_index = index_new
 
+    @classmethod
+    def _pointer_props(cls) -> Tuple[str, ...]:
+        """Names of the entity pointer index properties, collected once per class"""
+        props = cls.__dict__.get("_cached_pointer_props")
+        if props is None:
+            names = {}
+            for base in cls.__mro__:
+                for name in base.__dict__.get("__annotations__", {}):
+                    if name.endswith("_i"):
+                        names[name] = None
+            props = tuple(names)
+            cls._cached_pointer_props = props
+        return props
+
     def connection_points(self):
         return []
 
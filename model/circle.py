@@ -3,10 +3,10 @@ import math
 from typing import List
 
 import bpy
+import numpy as np
 from bpy.types import PropertyGroup
 from bpy.props import FloatProperty
-from gpu_extras.batch import batch_for_shader
-from mathutils import Vector, Matrix
+from mathutils import Vector
 from mathutils.geometry import intersect_line_sphere_2d, intersect_sphere_sphere_2d
 from bpy.utils import register_classes_factory
 
@@ -19,7 +19,7 @@ from .base_entity import Entity2D, tag_update
 from .utilities import slvs_entity_pointer
 from .constants import CURVE_RESOLUTION
 from ..utilities.constants import HALF_TURN, FULL_TURN
-from ..utilities.draw import coords_arc_2d
+from ..utilities.draw import coords_arc_2d, index_polylines, transform_coords_2d
 from .utilities import (
     get_bezier_curve_midpoint_positions,
     create_bezier_curve,
@@ -70,32 +70,28 @@ class SlvsCircle(Entity2D, PropertyGroup):
         if bpy.app.background:
             return
 
+        indices = None
         if self.is_dashed():
             # Create dashed circle geometry
-            coords = self._create_dashed_circle_coords()
+            coords, indices = self._create_dashed_circle_coords()
         else:
             # Standard solid circle
-            coords = coords_arc_2d(0, 0, self.radius, CURVE_RESOLUTION)
+            coords = coords_arc_2d(*self.ct.co, self.radius, CURVE_RESOLUTION)
 
-        u, v = self.ct.co
-        mat_local = Matrix.Translation(Vector((u, v, 0)))
-        mat = self.wp.matrix_basis @ mat_local
-        coords = [(mat @ Vector((*co, 0)))[:] for co in coords]
+        coords = transform_coords_2d(coords, self.wp.matrix_basis)
 
         if self.is_dashed():
             # For dashed circles, use LINES instead of LINE_STRIP
-            kwargs = {"pos": coords}
-            self._batch = batch_for_shader(self._shader, "LINES", kwargs)
+            self._update_batch(self._shader, "LINES", coords, indices=indices)
         else:
-            kwargs = {"pos": coords}
-            self._batch = batch_for_shader(self._shader, "LINE_STRIP", kwargs)
+            self._update_batch(self._shader, "LINE_STRIP", coords)
         self.is_dirty = False
 
     def _create_dashed_circle_coords(self):
-        """Create coordinates for a dashed circle with gaps."""
+        """Create coordinates and segment indices for a dashed circle with gaps."""
         radius = self.radius
         if radius <= 0:
-            return []
+            return [], None
 
         # Calculate segments per dash based on arc length
         dash_arc_length = RenderingConstants.DASH_LENGTH
@@ -109,34 +105,18 @@ class SlvsCircle(Entity2D, PropertyGroup):
         # Number of complete patterns that fit in a full circle
         num_patterns = int(FULL_TURN / pattern_angle)
 
-        coords = []
-        current_angle = 0.0
-
         # Use reasonable segment resolution for each dash
         segments_per_dash = max(3, int(CURVE_RESOLUTION * dash_angle / FULL_TURN))
 
-        for i in range(num_patterns):
-            # Create dash segment
-            dash_start = current_angle
-            dash_end = min(current_angle + dash_angle, FULL_TURN)
-
-            if dash_end > dash_start:
-                dash_coords = coords_arc_2d(0, 0, radius, segments_per_dash,
-                                          angle=(dash_end - dash_start),
-                                          offset=dash_start)
-
-                # Convert to line segments (pairs of points)
-                for j in range(len(dash_coords) - 1):
-                    coords.extend([dash_coords[j], dash_coords[j + 1]])
+        dash_starts = np.arange(num_patterns) * pattern_angle
+        dash_ends = np.minimum(dash_starts + dash_angle, FULL_TURN)
+        valid = dash_ends > dash_starts
 
-            # Move to next dash (skip gap)
-            current_angle += pattern_angle
-
-            # Stop if we've covered the entire circle
-            if current_angle >= FULL_TURN:
-                break
+        dashes = DashedLineRenderer.arc_dash_points(
+            self.ct.co, radius, dash_starts[valid], dash_ends[valid], segments_per_dash
+        )
 
-        return coords
+        return index_polylines(dashes)
 
     def create_slvs_data(self, solvesys, group=Solver.group_fixed):
         self.param_distance = solvesys.add_distance(group, self.radius, self.wp.py_data)
@@ -12,7 +12,7 @@ from .. import global_data
 from ..utilities.constants import QUARTER_TURN
 from ..utilities.index import breakdown_index, assemble_index
 
-from .base_entity import SlvsGenericEntity
+from .base_entity import SlvsGenericEntity, invalidate_reverse_deps
 from .utilities import slvs_entity_pointer, update_pointers
 from .point_3d import SlvsPoint3D
 from .line_3d import SlvsLine3D
@@ -149,6 +149,7 @@ class SlvsEntities(PropertyGroup):
 
         entity_list, i = self._get_list_and_index(index)
         entity_list.remove(i)
+        invalidate_reverse_deps()
 
         # Invalidate performance cache when entity is removed
         from ..draw_handler import reset_performance_cache
@@ -177,6 +178,7 @@ class SlvsEntities(PropertyGroup):
         entity["visible"] = visible
 
         index = self._set_index(entity)
+        invalidate_reverse_deps()
 
         # Invalidate performance cache when entity is created
         from ..draw_handler import reset_performance_cache
@@ -12,6 +12,7 @@ from .utilities import slvs_entity_pointer
 from .base_entity import SlvsGenericEntity
 from .group_entities import SlvsEntities
 from .group_constraints import SlvsConstraints
+from ..utilities import gpu_pool
 from ..utilities.view import update_cb
 
 logger = logging.getLogger(__name__)
@@ -60,6 +61,10 @@ class SketcherProps(PropertyGroup):
         global_data.hover = -1
         global_data.selected.clear()
         global_data.batches.clear()
+        global_data.batch_keys.clear()
+        gpu_pool.clear()
+        global_data.reverse_deps = None
+        global_data.pending_dirty.clear()
         for e in self.entities.all:
             e.dirty = True
 
@@ -4,13 +4,12 @@ from typing import List, Tuple
 
 import bpy
 from bpy.types import PropertyGroup, Context
-from gpu_extras.batch import batch_for_shader
 from bpy.utils import register_classes_factory
-from mathutils import Matrix, Vector
+from mathutils import Vector
 from mathutils.geometry import intersect_line_line, intersect_line_line_2d
 
 from ..utilities.constants import RenderingConstants
-from .vulkan_compat import GeometryRenderer, DashedLineRenderer
+from .vulkan_compat import DashedLineRenderer
 from ..solver import Solver
 from .base_entity import SlvsGenericEntity
 from .base_entity import Entity2D
@@ -21,7 +20,7 @@ from ..utilities.geometry import nearest_point_line_line
 logger = logging.getLogger(__name__)
 
 
-class SlvsLine2D(Entity2D, GeometryRenderer, PropertyGroup):
+class SlvsLine2D(Entity2D, PropertyGroup):
     """Representation of a line in 2D space. Connects p1 and p2 and lies on the
     sketche's workplane.
 
@@ -63,11 +62,11 @@ class SlvsLine2D(Entity2D, GeometryRenderer, PropertyGroup):
         if self.is_dashed():
             # Create dashed line geometry using utility
             coords = DashedLineRenderer.create_dashed_coords(p1, p2)
-            self._batch = self.setup_line_rendering(coords, is_dashed=True)
+            self._update_batch(self._shader, "LINES", coords)
         else:
             # Standard solid line
             coords = (p1, p2)
-            self._batch = self.setup_line_rendering(coords, is_dashed=False)
+            self._update_batch(self._shader, "LINE_STRIP", coords)
 
         self.is_dirty = False
 
@@ -166,10 +165,13 @@ class SlvsLine2D(Entity2D, GeometryRenderer, PropertyGroup):
 
     def normal(self, position=None):
         """Returns vector perpendicular to line, position is ignored"""
-        mat_rot = Matrix.Rotation(-math.pi / 2, 2, "Z")
-        nm = self.direction_vec()
-        nm.rotate(mat_rot)
-        return nm
+        # Direction rotated by -90 degrees, avoids building a rotation matrix
+        p1, p2 = self.p1.co, self.p2.co
+        dx, dy = p2.x - p1.x, p2.y - p1.y
+        length = math.hypot(dx, dy)
+        if length == 0.0:
+            return Vector((0.0, 0.0))
+        return Vector((dy / length, -dx / length))
 
     @property
     def length(self):
@@ -3,7 +3,6 @@ from typing import List
 
 import bpy
 from bpy.types import PropertyGroup
-from gpu_extras.batch import batch_for_shader
 from bpy.utils import register_classes_factory
 
 from ..utilities.constants import RenderingConstants
@@ -51,13 +50,10 @@ class SlvsLine3D(SlvsGenericEntity, PropertyGroup):
         if self.is_dashed():
             # Create dashed line geometry
             coords = DashedLineRenderer.create_dashed_coords(p1, p2)
-            kwargs = {"pos": coords}
-            self._batch = batch_for_shader(self._shader, "LINES", kwargs)
+            self._update_batch(self._shader, "LINES", coords)
         else:
             # Standard solid line
-            coords = (p1, p2)
-            kwargs = {"pos": coords}
-            self._batch = batch_for_shader(self._shader, "LINES", kwargs)
+            self._update_batch(self._shader, "LINES", (p1, p2))
 
         self.is_dirty = False
 
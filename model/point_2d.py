@@ -3,7 +3,7 @@ from typing import List
 
 from bpy.types import PropertyGroup
 from bpy.props import FloatVectorProperty
-from mathutils import Matrix, Vector
+from mathutils import Vector
 from bpy.utils import register_classes_factory
 
 from ..solver import Solver
@@ -22,10 +22,7 @@ class Point2D(Entity2D, BillboardPointRenderer):
 
     def get_point_location_3d(self):
         """Get the 3D location for point rendering."""
-        u, v = self.co
-        mat_local = Matrix.Translation(Vector((u, v, 0)))
-        mat = self.wp.matrix_basis @ mat_local
-        return mat @ Vector((0, 0, 0))
+        return self.location
 
     def update(self):
         """Update screen-space point geometry."""
@@ -35,12 +32,13 @@ class Point2D(Entity2D, BillboardPointRenderer):
         """Draw billboard point with camera-facing geometry."""
         return self.draw_billboard_point(context)
 
+    def draw_id(self, context):
+        return self.draw_billboard_point_id(context)
+
     @property
     def location(self):
         u, v = self.co
-        mat_local = Matrix.Translation(Vector((u, v, 0)))
-        mat = self.wp.matrix_basis @ mat_local
-        return mat @ Vector((0, 0, 0))
+        return self.wp.matrix_basis @ Vector((u, v, 0.0))
 
     def placement(self):
         return self.location
@@ -30,6 +30,9 @@ class Point3D(SlvsGenericEntity, BillboardPointRenderer):
         """Draw billboard point with camera-facing geometry."""
         return self.draw_billboard_point(context)
 
+    def draw_id(self, context):
+        return self.draw_billboard_point_id(context)
+
     # TODO: maybe rename -> pivot_point, midpoint
     def placement(self):
         return self.location
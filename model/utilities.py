@@ -25,9 +25,16 @@ def slvs_entity_pointer(cls, name, **kwargs):
 
     @func.setter
     def setter(self, entity):
+        # NOTE: Imported here as base_entity indirectly imports this module
+        from .base_entity import SlvsGenericEntity, invalidate_reverse_deps
+
         index = entity.slvs_index if entity else -1
         setattr(self, index_prop, index)
 
+        # Only pointers between entities are part of the reverse dependency map
+        if isinstance(self, SlvsGenericEntity):
+            invalidate_reverse_deps()
+
     setattr(cls, name, setter)
 
 
@@ -133,4 +140,8 @@ def update_pointers(scene, index_old, index_new):
             continue
         o.update_pointers(index_old, index_new)
 
+    from .base_entity import invalidate_reverse_deps
+
+    invalidate_reverse_deps()
+
     scene.sketcher.purge_stale_data()
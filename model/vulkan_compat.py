@@ -8,126 +8,86 @@ to ensure consistent visual appearance across all GPU backends.
 import logging
 import bpy
 import gpu
-from gpu_extras.batch import batch_for_shader
+import numpy as np
 from mathutils import Vector
 
 from ..utilities.constants import RenderingConstants
-from ..utilities.draw import draw_billboard_quad_3d
+from ..utilities.draw import batch_from_arrays, index_polylines, pack_coords
 from ..utilities.gpu_manager import ShaderManager
+from ..utilities.index import index_to_rgb
 
 logger = logging.getLogger(__name__)
 
-
-class GeometryRenderer:
-    """Mixin class providing geometry-based rendering methods for entities."""
-
-    def create_batch(self, coords, batch_type="LINES", indices=None):
-        """Create a GPU batch with appropriate parameters."""
-        kwargs = {"pos": coords}
-        # Use cached shader instead of _shader property
-        shader = ShaderManager.get_polyline_shader() if batch_type in ("LINES", "LINE_STRIP") else ShaderManager.get_uniform_color_shader()
-        if indices is not None:
-            return batch_for_shader(shader, batch_type, kwargs, indices=indices)
-        return batch_for_shader(shader, batch_type, kwargs)
-
-    def setup_line_rendering(self, coords, is_dashed=False):
-        """Setup line rendering with proper batch type."""
-        if is_dashed:
-            # Dashed lines use LINES (individual segments)
-            return self.create_batch(coords, "LINES")
-        else:
-            # Solid lines can use LINE_STRIP for efficiency
-            return self.create_batch(coords, "LINE_STRIP")
-
-    def setup_point_rendering(self, coords, indices):
-        """Setup point rendering using triangle geometry."""
-        # Points as triangles for all backends
-        return self.create_batch(coords, "TRIS", indices)
+# Corner offsets and triangles of a billboard quad, see BillboardPointRenderer
+_BILLBOARD_CORNERS = np.array(
+    ((-0.5, -0.5), (0.5, -0.5), (0.5, 0.5), (-0.5, 0.5)), dtype=np.float32
+)
+_BILLBOARD_INDICES = np.array(((0, 1, 2), (2, 3, 0)), dtype=np.uint32)
 
 
 class BillboardPointRenderer:
-    """Mixin class providing screen-space point rendering."""
+    """Mixin class providing screen-space point rendering.
+
+    The batch stores the point's location for every corner of the quad, the
+    billboard shader offsets the corners in view space. The geometry therefore
+    only depends on the point's location and not on the view.
+    """
 
     def get_point_location_3d(self):
         """Get the 3D location for point rendering. Override in subclasses."""
         raise NotImplementedError("Subclasses must implement get_point_location_3d()")
 
     def update_billboard_point(self):
-        """Update method for billboard points - creates base geometry."""
+        """Update method for billboard points - creates the quad at the point's location."""
         if bpy.app.background:
             return
 
-        # Mark as needing update but don't create geometry until needed
-        self._needs_billboard_update = True
+        location = pack_coords(self.get_point_location_3d())
+        coords = np.repeat(location, 4, axis=0)
+        self._batch = batch_from_arrays(
+            ShaderManager.get_billboard_shader(),
+            "TRIS",
+            coords,
+            _BILLBOARD_INDICES,
+            corner=_BILLBOARD_CORNERS,
+        )
         self.is_dirty = False
 
-    def _ensure_billboard_geometry(self, context):
-        """Lazy creation of billboard geometry only when needed for drawing."""
-        if not getattr(self, '_needs_billboard_update', True):
+    @staticmethod
+    def _billboard_size(context):
+        view_distance = None
+        if hasattr(context, 'region_data') and context.region_data:
+            view_distance = getattr(context.region_data, 'view_distance', 1.0)
+
+        if view_distance:
+            # Use correct scaling factor - matches original working implementation
+            return RenderingConstants.POINT_SIZE * view_distance * RenderingConstants.POINT_SIZE
+        return RenderingConstants.POINT_SIZE
+
+    def _draw_billboard(self, context, color):
+        batch = self._batch
+        if not batch:
             return
 
-        # Create a basic batch - size will be calculated during draw
-        location_3d = self.get_point_location_3d()
-        coords, indices = draw_billboard_quad_3d(*location_3d, 0.01)  # Base size
-        shader = ShaderManager.get_uniform_color_shader()
-        self._batch = batch_for_shader(shader, "TRIS", {"pos": coords}, indices=indices)
-        self._cached_view_distance = None  # Reset cache
-        self._needs_billboard_update = False
+        shader = ShaderManager.get_billboard_shader()
+        shader.bind()
+        shader.uniform_float("size", self._billboard_size(context))
+        shader.uniform_float("color", color)
+        batch.draw(shader)
+        gpu.shader.unbind()
 
     def draw_billboard_point(self, context):
-        """Draw method for billboard points - efficient with view-change detection."""
+        """Draw method for billboard points, the quad is expanded on the GPU."""
         if not self.is_visible(context):
             return
 
-        # Ensure geometry exists (lazy initialization)
-        self._ensure_billboard_geometry(context)
-
-        # Lazy initialization of cache
-        if not hasattr(self, '_cached_view_distance'):
-            self._cached_view_distance = None
-
-        # Check if view has changed and we need to regenerate geometry
-        current_view_distance = None
-        if hasattr(context, 'region_data') and context.region_data:
-            current_view_distance = getattr(context.region_data, 'view_distance', 1.0)
-
-        # Only regenerate geometry if view distance changed significantly
-        needs_update = (
-            self._cached_view_distance is None or  # First time
-            (current_view_distance is None) != (self._cached_view_distance is None) or  # None state changed
-            (current_view_distance is not None and self._cached_view_distance is not None and
-             abs(current_view_distance - self._cached_view_distance) > RenderingConstants.VIEW_CHANGE_THRESHOLD)  # Significant change
-        )
-
-        if needs_update:
-            # Calculate proper screen-space size
-            location_3d = self.get_point_location_3d()
-
-            if current_view_distance:
-                # Use correct scaling factor - matches original working implementation
-                screen_size = RenderingConstants.POINT_SIZE * current_view_distance * RenderingConstants.POINT_SIZE
-            else:
-                screen_size = RenderingConstants.POINT_SIZE
-
-            # Regenerate billboard geometry with new size
-            coords, indices = draw_billboard_quad_3d(*location_3d, screen_size)
-            shader = ShaderManager.get_uniform_color_shader()
-            self._batch = batch_for_shader(shader, "TRIS", {"pos": coords}, indices=indices)
-            self._cached_view_distance = current_view_distance
-
-        # Efficient rendering of cached geometry using cached shader
-        shader = ShaderManager.get_uniform_color_shader()
-        shader.bind()
         gpu.state.blend_set("ALPHA")
+        self._draw_billboard(context, self.color(context))
+        self.restore_opengl_defaults()
 
-        col = self.color(context)
-        shader.uniform_float("color", col)
-
-        batch = self._batch
-        if batch:
-            batch.draw(shader)
-
-        gpu.shader.unbind()
+    def draw_billboard_point_id(self, context):
+        """Draw the billboard point into the selection buffer."""
+        self._draw_billboard(context, (*index_to_rgb(self.slvs_index), 1.0))
         self.restore_opengl_defaults()
 
 
@@ -137,42 +97,47 @@ class DashedLineRenderer:
     @staticmethod
     def create_dashed_coords(start_point, end_point):
         """Create dashed line coordinates between two points."""
-        line_vec = end_point - start_point
-        line_length = line_vec.length
+        start = np.asarray(start_point, dtype=np.float64)
+        line_vec = np.asarray(end_point, dtype=np.float64) - start
+        line_length = float(np.sqrt(line_vec @ line_vec))
 
         if line_length == 0:
-            return [start_point, end_point]
+            return pack_coords((start_point, end_point))
 
         # Use centralized constants
         dash_length = RenderingConstants.DASH_LENGTH
         pattern_length = RenderingConstants.dash_pattern_length()
 
-        coords = []
-        direction = line_vec.normalized()
-
-        current_pos = 0.0
-        while current_pos < line_length:
-            # Start of dash
-            dash_start = start_point + direction * current_pos
-            dash_end_pos = min(current_pos + dash_length, line_length)
-            dash_end = start_point + direction * dash_end_pos
+        # Distances of all dash starts and ends along the line, one dash per pattern
+        dash_starts = np.arange(0.0, line_length, pattern_length)
+        dash_ends = np.minimum(dash_starts + dash_length, line_length)
+        positions = np.stack((dash_starts, dash_ends), axis=1).ravel()
 
-            # Add dash segment
-            coords.extend([dash_start, dash_end])
+        return pack_coords(start + np.outer(positions, line_vec / line_length))
 
-            # Move to next dash (skip gap)
-            current_pos += pattern_length
-
-        return coords
+    @staticmethod
+    def arc_dash_points(center, radius, dash_starts, dash_ends, segments_per_dash):
+        """Points of arc dashes around center, evaluated for all dashes at once.
+
+        Returns an array of shape (dashes, segments_per_dash + 1, 2).
+        """
+        t = np.arange(segments_per_dash + 1) / segments_per_dash
+        angles = dash_starts[:, None] + (dash_ends - dash_starts)[:, None] * t
+
+        points = np.empty(angles.shape + (2,), dtype=np.float32)
+        np.cos(angles, out=points[..., 0])
+        np.sin(angles, out=points[..., 1])
+        points *= radius
+        if center is not None:
+            points += tuple(center)
+        return points
 
     @staticmethod
     def create_dashed_arc_coords(center, radius, total_angle, start_offset, segments_per_dash):
-        """Create dashed arc coordinates."""
-        from ..utilities.draw import coords_arc_2d
-        import math
-
+        """Create dashed arc coordinates, returns the coordinates and the
+        indices of the line segments, see index_polylines()."""
         if radius <= 0 or total_angle <= 0:
-            return []
+            return [], None
 
         # Convert world units to angular measurements
         dash_length_world = RenderingConstants.DASH_LENGTH
@@ -185,42 +150,19 @@ class DashedLineRenderer:
         # Calculate number of complete patterns that fit in the arc
         num_patterns = int(total_angle / pattern_angle)
 
-        coords = []
-        current_angle = 0.0
-
-        for i in range(num_patterns):
-            # Create dash segment within the arc
-            dash_start = current_angle
-            dash_end = min(current_angle + dash_angle, total_angle)
-
-            if dash_end > dash_start:
-                # Generate points for this dash
-                dash_coords = coords_arc_2d(0, 0, radius, segments_per_dash,
-                                          angle=(dash_end - dash_start),
-                                          offset=(start_offset + dash_start))
-
-                # Convert to line segments (pairs of points)
-                for j in range(len(dash_coords) - 1):
-                    coords.extend([dash_coords[j], dash_coords[j + 1]])
-
-            # Move to next dash (skip gap)
-            current_angle += pattern_angle
-
-            # Stop if we've covered the entire arc
-            if current_angle >= total_angle:
-                break
-
-        # Add final partial dash if there's remaining arc length
-        if current_angle < total_angle:
-            dash_start = current_angle
-            dash_end = total_angle
-
-            if dash_end > dash_start:
-                dash_coords = coords_arc_2d(0, 0, radius, segments_per_dash,
-                                          angle=(dash_end - dash_start),
-                                          offset=(start_offset + dash_start))
-
-                for j in range(len(dash_coords) - 1):
-                    coords.extend([dash_coords[j], dash_coords[j + 1]])
+        # Dashes start at every complete pattern, a final partial dash
+        # covers the remaining arc length
+        dash_starts = np.arange(num_patterns + 1) * pattern_angle
+        dash_ends = np.minimum(dash_starts + dash_angle, total_angle)
+        dash_ends[-1] = total_angle
+        valid = dash_ends > dash_starts
+
+        dashes = DashedLineRenderer.arc_dash_points(
+            center,
+            radius,
+            dash_starts[valid] + start_offset,
+            dash_ends[valid] + start_offset,
+            segments_per_dash,
+        )
 
-        return coords
\ No newline at end of file
+        return index_polylines(dashes)
\ No newline at end of file
@@ -3,15 +3,16 @@ from typing import List
 
 import bpy
 import gpu
+import numpy as np
 from mathutils import Vector, Matrix
 from bpy.types import PropertyGroup
-from gpu_extras.batch import batch_for_shader
 from bpy.utils import register_classes_factory
 
 from ..declarations import Operators
 from .. import global_data
-from ..utilities.draw import draw_rect_2d
+from ..utilities.index import index_to_rgb
 from ..utilities.gpu_manager import ShaderManager
+from ..utilities.workplane_renderer import WorkplaneRenderer, get_geometry
 from ..shaders import Shaders
 from ..utilities import preferences
 from ..solver import Solver
@@ -21,6 +22,8 @@ from .utilities import slvs_entity_pointer
 
 logger = logging.getLogger(__name__)
 
+_BORDER_INDICES = np.array(((0, 1), (1, 2), (2, 3), (3, 0)), dtype=np.uint32)
+
 
 class SlvsWorkplane(SlvsGenericEntity, PropertyGroup):
     """Representation of a plane which is defined by an origin point
@@ -45,14 +48,11 @@ class SlvsWorkplane(SlvsGenericEntity, PropertyGroup):
         if bpy.app.background:
             return
 
-        p1, nm = self.p1, self.nm
-
-        coords = draw_rect_2d(0, 0, self.size, self.size)
-        coords = [(Vector(co))[:] for co in coords]
-
-        indices = ((0, 1), (1, 2), (2, 3), (3, 0))
-        self._batch = batch_for_shader(
-            self._shader, "LINES", {"pos": coords}, indices=indices
+        # The border is identical for all workplanes of the same size and
+        # shared through the batch pool like other shared entity geometry
+        coords = get_geometry(self.size).coords
+        self._update_batch(
+            self._shader, "LINES", coords, indices=_BORDER_INDICES, shared=True
         )
         self.is_dirty = False
 
@@ -61,62 +61,46 @@ class SlvsWorkplane(SlvsGenericEntity, PropertyGroup):
         if not self.is_visible(context):
             return
 
+        matrix_basis = self.matrix_basis
         with gpu.matrix.push_pop():
             scale = context.region_data.view_distance
-            gpu.matrix.multiply_matrix(self.matrix_basis)
+            gpu.matrix.multiply_matrix(matrix_basis)
             gpu.matrix.scale(Vector((scale, scale, scale)))
 
             col = self.color(context)
             # Let parent draw outline
             super().draw(context)
 
-            # Additionally draw a face
+            # Additionally draw a face, surfaces of all workplanes share
+            # the same geometry and are drawn at once after the workplanes
             col_surface = col[:-1] + (0.2,)
-
-            shader = ShaderManager.get_uniform_color_shader()
-            shader.bind()
-            gpu.state.blend_set("ALPHA")
-
-            shader.uniform_float("color", col_surface)
-
-            coords = draw_rect_2d(0, 0, self.size, self.size)
-            coords = [Vector(co)[:] for co in coords]
-            indices = ((0, 1, 2), (0, 2, 3))
-            batch = batch_for_shader(shader, "TRIS", {"pos": coords}, indices=indices)
-            batch.draw(shader)
+            WorkplaneRenderer.enqueue(
+                self.size, matrix_basis @ Matrix.Scale(scale, 4), col_surface
+            )
 
         self.restore_opengl_defaults()
 
-    def draw_id(self, context):
+    def draw_id(self, context, full=False):
+        """Draw the workplane into the selection buffer, the surface is only
+        drawn when full is set, otherwise only the border is pickable"""
         with gpu.matrix.push_pop():
             scale = context.region_data.view_distance
             gpu.matrix.multiply_matrix(self.matrix_basis)
             gpu.matrix.scale(Vector((scale, scale, scale)))
 
-            # Draw both the outline (lines) and the surface (triangles) for selection
-            # This makes the entire plane selectable, not just the edges
             super().draw_id(context)
 
+            if not full:
+                self.restore_opengl_defaults()
+                return
+
             # Draw workplane surface both behind and slightly in front of outline
             # This creates maximum selectability while preserving outline visibility
             shader = self._id_shader
             shader.bind()
-
-            from ..utilities.index import index_to_rgb
             shader.uniform_float("color", (*index_to_rgb(self.slvs_index), 1.0))
 
-            coords = draw_rect_2d(0, 0, self.size, self.size)
-
-            # Draw surface behind outline (for areas not covered by outline)
-            coords_behind = [(co[0], co[1], co[2] - 0.0001) for co in coords]
-            indices = ((0, 1, 2), (0, 2, 3))
-            batch_behind = batch_for_shader(shader, "TRIS", {"pos": coords_behind}, indices=indices)
-            batch_behind.draw(shader)
-
-            # Draw surface slightly in front of outline (for better selection area)
-            coords_front = [(co[0], co[1], co[2] + 0.0001) for co in coords]
-            batch_front = batch_for_shader(shader, "TRIS", {"pos": coords_front}, indices=indices)
-            batch_front.draw(shader)
+            get_geometry(self.size).id_surface.draw(shader)
 
             gpu.shader.unbind()
             self.restore_opengl_defaults()
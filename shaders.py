@@ -13,6 +13,23 @@ else:
     cache = lru_cache(maxsize=None)
 
 
+# Same conversion as Blender's builtin shaders, srgbTarget is a builtin uniform
+# that gets set when the shader is bound. Offscreen buffers, e.g. the selection
+# buffer, aren't sRGB targets so id colors are written unchanged.
+_SRGB_TO_FRAMEBUFFER_SPACE = """
+    vec4 blender_srgb_to_framebuffer_space(vec4 color)
+    {
+        if (srgbTarget) {
+            vec3 c = max(color.rgb, vec3(0.0));
+            vec3 c1 = c * (1.0 / 12.92);
+            vec3 c2 = pow((c + 0.055) * (1.0 / 1.055), vec3(2.4));
+            color.rgb = mix(c1, c2, step(vec3(0.04045), c));
+        }
+        return color;
+    }
+"""
+
+
 class Shaders:
 
     @classmethod
@@ -58,6 +75,98 @@ class Shaders:
         del shader_info
         return shader
 
+    @staticmethod
+    @cache
+    def instanced_surface_3d(max_instances):
+        """Uniform color surface drawn once per instance, every instance reads
+        its model matrix and color from a uniform buffer."""
+        vert_out = GPUStageInterfaceInfo("instanced_surface_3d_interface")
+        vert_out.flat("VEC4", "v_color")
+
+        shader_info = GPUShaderCreateInfo()
+        shader_info.typedef_source(
+            f"""
+            struct SurfaceInstances {{
+                mat4 model[{max_instances}];
+                vec4 color[{max_instances}];
+            }};
+        """
+        )
+        shader_info.uniform_buf(0, "SurfaceInstances", "instances")
+        shader_info.push_constant("MAT4", "ViewProjectionMatrix")
+        shader_info.push_constant("BOOL", "srgbTarget")
+        shader_info.vertex_in(0, "VEC3", "pos")
+        shader_info.vertex_out(vert_out)
+        shader_info.fragment_out(0, "VEC4", "fragColor")
+
+        shader_info.vertex_source(
+            """
+            void main()
+            {
+                gl_Position = (
+                    ViewProjectionMatrix
+                    * instances.model[gl_InstanceID]
+                    * vec4(pos, 1.0f)
+                );
+                v_color = instances.color[gl_InstanceID];
+            }
+        """
+        )
+        shader_info.fragment_source(
+            _SRGB_TO_FRAMEBUFFER_SPACE
+            + """
+            void main()
+            {
+                fragColor = blender_srgb_to_framebuffer_space(v_color);
+            }
+        """
+        )
+
+        shader = create_from_info(shader_info)
+        del vert_out
+        del shader_info
+        return shader
+
+    @staticmethod
+    @cache
+    def billboard_point_3d():
+        """Camera facing quad, every vertex holds the point's center and is
+        offset by its corner in view space, so the quad doesn't have to be
+        rebuilt when the view changes. Used for both drawing and selection."""
+        shader_info = GPUShaderCreateInfo()
+        shader_info.push_constant("MAT4", "ModelViewMatrix")
+        shader_info.push_constant("MAT4", "ProjectionMatrix")
+        shader_info.push_constant("FLOAT", "size")
+        shader_info.push_constant("VEC4", "color")
+        shader_info.push_constant("BOOL", "srgbTarget")
+        shader_info.vertex_in(0, "VEC3", "pos")
+        shader_info.vertex_in(1, "VEC2", "corner")
+        shader_info.fragment_out(0, "VEC4", "fragColor")
+
+        shader_info.vertex_source(
+            """
+            void main()
+            {
+                vec4 view_pos = ModelViewMatrix * vec4(pos, 1.0f);
+                view_pos.xy += corner * size;
+                gl_Position = ProjectionMatrix * view_pos;
+            }
+        """
+        )
+        shader_info.fragment_source(
+            _SRGB_TO_FRAMEBUFFER_SPACE
+            + """
+            void main()
+            {
+                fragColor = blender_srgb_to_framebuffer_space(color);
+            }
+        """
+        )
+
+        shader = create_from_info(shader_info)
+        del shader_info
+        return shader
+
     @staticmethod
     @cache
     def id_shader_3d():
@@ -40,3 +40,231 @@ class TestEntities(BgsTestCase):
 
         del bpy.types.Scene.test_group
         unregister_class(PointerTest)
+
+    def test_dirty_propagation(self):
+        from bl_ext.extensions.CAD_Sketcher.model.base_entity import (
+            flush_pending_dirty,
+        )
+
+        entities = self.entities
+
+        p1 = entities.add_point_3d((0, 0, 0), index_reference=True)
+        p2 = entities.add_point_3d((1, 0, 0), index_reference=True)
+        line = entities.add_line_3d(p1, p2, index_reference=True)
+
+        for index in (p1, p2, line):
+            entities.get(index).is_dirty = False
+
+        entities.get(p1).location = (0, 1, 0)
+        flush_pending_dirty(self.scene)
+
+        self.assertTrue(entities.get(p1).is_dirty)
+        self.assertTrue(entities.get(line).is_dirty)
+        self.assertFalse(entities.get(p2).is_dirty)
+
+    def test_import_model_utilities_first(self):
+        import importlib
+        import sys
+
+        package = "bl_ext.extensions.CAD_Sketcher"
+        prefix = package + "."
+        loaded = {k: v for k, v in sys.modules.items() if k.startswith(prefix)}
+
+        # Import the submodules into a fresh state, importing model.utilities
+        # first must not run into a circular import
+        try:
+            for name in loaded:
+                del sys.modules[name]
+            importlib.import_module(prefix + "model.utilities")
+        finally:
+            for name in [k for k in sys.modules if k.startswith(prefix)]:
+                del sys.modules[name]
+            sys.modules.update(loaded)
+
+
+class TestDrawUtilities(BgsTestCase):
+    def test_arc_negative_radius(self):
+        from bl_ext.extensions.CAD_Sketcher.utilities.constants import QUARTER_TURN
+        from bl_ext.extensions.CAD_Sketcher.utilities.draw import coords_arc_2d
+
+        coords = coords_arc_2d(0, 0, -2.0, 8, angle=QUARTER_TURN, type="LINES")
+
+        # A negative radius mirrors the arc instead of collapsing it
+        self.assertEqual(len(coords), 16)
+        self.assertAlmostEqual(coords[0][0], -2.0, places=5)
+        self.assertAlmostEqual(coords[-1][1], -2.0, places=5)
+
+        coords = coords_arc_2d(0, 0, -1e-9, 8, angle=QUARTER_TURN, type="LINES")
+        self.assertEqual(len(coords), 2)
+
+    def test_arc_coords(self):
+        import numpy as np
+        from bl_ext.extensions.CAD_Sketcher.utilities.constants import FULL_TURN
+        from bl_ext.extensions.CAD_Sketcher.utilities.draw import (
+            coords_arc_2d,
+            coords_circle_2d,
+        )
+
+        # Full circles with a multiple of four segments use the quarter table
+        for segments, angle, offset in ((64, FULL_TURN, 0.0), (10, 1.3, 0.4)):
+            coords = coords_arc_2d(1.0, -2.0, 3.0, segments, angle=angle, offset=offset)
+            expected = _arc_reference(1.0, -2.0, 3.0, segments, angle, offset)
+            self.assertEqual(coords.dtype, np.float32)
+            np.testing.assert_allclose(coords, expected, atol=1e-5)
+
+            lines = coords_arc_2d(
+                1.0, -2.0, 3.0, segments, angle=angle, offset=offset, type="LINES"
+            )
+            expected = [co for pair in zip(expected, expected[1:]) for co in pair]
+            np.testing.assert_allclose(lines, expected, atol=1e-5)
+
+        coords = coords_circle_2d(0.5, 0.5, 2.0, 33)
+        np.testing.assert_allclose(
+            coords, _arc_reference(0.5, 0.5, 2.0, 32, FULL_TURN, 0.0), atol=1e-5
+        )
+
+    def test_arc_coords_degenerate(self):
+        import numpy as np
+        from bl_ext.extensions.CAD_Sketcher.utilities.draw import coords_arc_2d
+
+        coords = coords_arc_2d(1.0, 2.0, 0.0, 16)
+        np.testing.assert_allclose(coords, ((1.0, 2.0), (1.0, 2.0)))
+
+        coords = coords_arc_2d(1.0, 2.0, 3.0, 16, angle=1e-9, offset=0.5)
+        self.assertEqual(len(coords), 2)
+        np.testing.assert_allclose(
+            coords, _arc_reference(1.0, 2.0, 3.0, 1, 1e-9, 0.5), atol=1e-5
+        )
+
+    def test_transform_coords_2d(self):
+        import numpy as np
+        from mathutils import Euler, Matrix, Vector
+        from bl_ext.extensions.CAD_Sketcher.utilities.draw import transform_coords_2d
+
+        rotation = Euler((0.3, -0.7, 1.1)).to_matrix().to_4x4()
+        mat = Matrix.Translation((1.0, -2.0, 3.0)) @ rotation
+        coords = ((0.0, 0.0), (1.5, -0.5), (-2.0, 4.0))
+
+        result = transform_coords_2d(coords, mat)
+        expected = [tuple(mat @ Vector((x, y, 0.0))) for x, y in coords]
+        self.assertEqual(result.dtype, np.float32)
+        np.testing.assert_allclose(result, expected, atol=1e-5)
+
+    def test_index_polylines(self):
+        import numpy as np
+        from bl_ext.extensions.CAD_Sketcher.utilities.draw import index_polylines
+
+        lines = np.arange(24, dtype=np.float32).reshape(3, 4, 2)
+
+        # Equal length polylines as an array give the same result as a list
+        coords, indices = index_polylines(lines)
+        list_coords, list_indices = index_polylines(list(lines))
+        np.testing.assert_array_equal(coords, np.array(list_coords))
+        np.testing.assert_array_equal(indices, list_indices)
+
+        segments = np.asarray(coords)[indices].reshape(-1, 2, 2)
+        expected = [(line[i], line[i + 1]) for line in lines for i in range(3)]
+        np.testing.assert_array_equal(segments, expected)
+
+        coords, indices = index_polylines(np.empty((0, 4, 2)))
+        self.assertIsNone(indices)
+
+    def test_dashed_line_coords(self):
+        import numpy as np
+        from mathutils import Vector
+        from bl_ext.extensions.CAD_Sketcher.model.vulkan_compat import (
+            DashedLineRenderer,
+        )
+        from bl_ext.extensions.CAD_Sketcher.utilities.constants import (
+            RenderingConstants,
+        )
+
+        start = Vector((0.1, 0.2, 0.3))
+        for end in (Vector((1.0, -0.4, 0.8)), start + Vector((0.04, 0.0, 0.0))):
+            coords = DashedLineRenderer.create_dashed_coords(start, end)
+            expected = _dashed_line_reference(start, end)
+            np.testing.assert_allclose(coords, expected, atol=1e-5)
+
+        # A dash longer than the line covers the whole line
+        short_end = start + Vector((RenderingConstants.DASH_LENGTH / 2, 0.0, 0.0))
+        coords = DashedLineRenderer.create_dashed_coords(start, short_end)
+        np.testing.assert_allclose(coords, (start, short_end), atol=1e-5)
+
+    def test_dashed_arc_coords(self):
+        import numpy as np
+        from bl_ext.extensions.CAD_Sketcher.model.vulkan_compat import (
+            DashedLineRenderer,
+        )
+
+        for radius, angle in ((1.0, 2.5), (0.3, 6.0), (5.0, 0.01)):
+            coords, indices = DashedLineRenderer.create_dashed_arc_coords(
+                None, radius, angle, 0.4, 4
+            )
+            segments = np.asarray(coords)[indices].reshape(-1, 2)
+            expected = _dashed_arc_reference(radius, angle, 0.4, 4)
+            np.testing.assert_allclose(segments, expected, atol=1e-5)
+
+        coords, indices = DashedLineRenderer.create_dashed_arc_coords(
+            None, 0.0, 1.0, 0.0, 4
+        )
+        self.assertIsNone(indices)
+
+
+# Reference implementations the vectorized draw helpers are checked against
+
+
+def _arc_reference(x, y, radius, segments, angle, offset):
+    from math import cos, sin
+
+    m = angle / segments
+    return [
+        (x + cos(m * p + offset) * radius, y + sin(m * p + offset) * radius)
+        for p in range(segments + 1)
+    ]
+
+
+def _dashed_line_reference(start, end):
+    from bl_ext.extensions.CAD_Sketcher.utilities.constants import RenderingConstants
+
+    line_vec = end - start
+    length = line_vec.length
+    direction = line_vec.normalized()
+
+    coords = []
+    position = 0.0
+    while position < length:
+        dash_end = min(position + RenderingConstants.DASH_LENGTH, length)
+        coords.extend((start + direction * position, start + direction * dash_end))
+        position += RenderingConstants.dash_pattern_length()
+    return coords
+
+
+def _dashed_arc_reference(radius, total_angle, start_offset, segments_per_dash):
+    from bl_ext.extensions.CAD_Sketcher.utilities.constants import RenderingConstants
+
+    dash_angle = RenderingConstants.DASH_LENGTH / radius
+    pattern_angle = dash_angle + RenderingConstants.GAP_LENGTH / radius
+
+    dashes = []
+    current = 0.0
+    for _ in range(int(total_angle / pattern_angle)):
+        dashes.append((current, min(current + dash_angle, total_angle)))
+        current += pattern_angle
+    if current < total_angle:
+        dashes.append((current, total_angle))
+
+    coords = []
+    for dash_start, dash_end in dashes:
+        if dash_end <= dash_start:
+            continue
+        points = _arc_reference(
+            0.0,
+            0.0,
+            radius,
+            segments_per_dash,
+            dash_end - dash_start,
+            start_offset + dash_start,
+        )
+        for i in range(len(points) - 1):
+            coords.extend((points[i], points[i + 1]))
+    return coords
@@ -33,9 +33,13 @@ class RenderingConstants:
 
     # Selection and depth sorting constants
     WORKPLANE_SELECTION_PRIORITY = 0.1  # Multiplier to give workplanes selection priority
-    VIEW_CHANGE_THRESHOLD = 0.001       # Minimum view distance change to trigger geometry update
+
+    # Arcs below these extents are drawn as a single segment
+    MIN_ARC_RADIUS = 1e-6
+    MIN_ARC_ANGLE = 1e-6
 
     # Performance constants
+    MAX_WORKPLANE_INSTANCES = 64        # Workplane surfaces drawn per instanced draw call
     CLEANUP_FRAME_INTERVAL = 1000       # Frames between GPU batch cleanup cycles
     CLEANUP_INTERVAL_SECONDS = 10.0     # Seconds between time-based cleanup cycles
 
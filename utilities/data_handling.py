@@ -1,5 +1,4 @@
-from collections import deque
-from typing import Generator, Deque, List, Sequence
+from typing import Generator, List, Sequence
 
 from bpy.types import Scene, Context
 
@@ -94,7 +93,7 @@ def is_entity_referenced(entity: SlvsGenericEntity, context: Context) -> bool:
 
 
 def get_sketch_deps_indicies(sketch: SlvsSketch, context: Context):
-    deps = deque()
+    deps = []
     for entity in get_scene_entities(context.scene):
         if not hasattr(entity, "sketch_i"):
             continue
@@ -106,12 +105,12 @@ def get_sketch_deps_indicies(sketch: SlvsSketch, context: Context):
 
 def get_constraint_local_indices(
     entity: SlvsGenericEntity, context: Context
-) -> Deque[int]:
+) -> List[tuple]:
     constraints = context.scene.sketcher.constraints
-    ret_list = deque()
+    ret_list = []
 
     for data_coll in constraints.get_lists():
-        indices = deque()
+        indices = []
         for c in data_coll:
             if entity in c.dependencies():
                 indices.append(constraints.get_index(c))
@@ -1,12 +1,12 @@
-from collections import deque
-from math import sin, cos
-from typing import List
+from functools import lru_cache
+from typing import List, Optional, Sequence, Tuple
 
-import bpy
+import numpy as np
+from gpu.types import GPUBatch, GPUIndexBuf, GPUVertBuf
 from mathutils import Vector, Matrix
 
 from .. import global_data
-from .constants import FULL_TURN
+from .constants import FULL_TURN, QUARTER_TURN, RenderingConstants
 
 
 def draw_rect_2d(cx: float, cy: float, width: float, height: float):
@@ -22,12 +22,97 @@ def draw_rect_2d(cx: float, cy: float, width: float, height: float):
     )
 
 
-def draw_rect_3d(origin: Vector, orientation: Vector, width: float) -> List[Vector]:
+def pack_coords(coords) -> np.ndarray:
+    """Pack 3d coordinates into a contiguous (N, 3) float32 array, the layout
+    GPU vertex buffers use, so batch creation doesn't have to convert every item"""
+    return np.ascontiguousarray(coords, dtype=np.float32).reshape(-1, 3)
+
+
+def batch_from_arrays(
+    shader, batch_type: str, coords, indices=None, **attributes
+) -> GPUBatch:
+    """Create a batch from packed arrays without going through python sequences.
+
+    Indices are passed as a uint32 buffer, GPUIndexBuf only accepts 4 byte
+    integers but Blender compacts index buffers to 16 bit when all indices
+    fit, which is always the case for the small geometries drawn here.
+    Additional float vertex attributes of the shader can be passed by name.
+    """
+    coords = pack_coords(coords)
+    vbo = GPUVertBuf(shader.format_calc(), len(coords))
+    vbo.attr_fill("pos", coords)
+    for name, data in attributes.items():
+        vbo.attr_fill(name, np.ascontiguousarray(data, dtype=np.float32))
+
+    if indices is None:
+        return GPUBatch(type=batch_type, buf=vbo)
+
+    ibo = GPUIndexBuf(
+        type=batch_type, seq=np.ascontiguousarray(indices, dtype=np.uint32)
+    )
+    return GPUBatch(type=batch_type, buf=vbo, elem=ibo)
+
+
+def index_polylines(polylines) -> Tuple[Sequence, Optional[np.ndarray]]:
+    """Join polylines into a single vertex list with indices for a LINES batch.
+
+    Vertices shared by two consecutive segments are only stored once and the
+    segments are indexed in order, so neighbouring lines reuse the previous
+    vertex. Returns None as indices when there are no segments.
+
+    Polylines of equal length can be passed as a (lines, points, dim) array,
+    their indices are then generated as an arithmetic progression.
+    """
+    if isinstance(polylines, np.ndarray) and polylines.ndim == 3:
+        lines, points = polylines.shape[:2]
+        coords = polylines.reshape(-1, polylines.shape[2])
+        if lines == 0 or points < 2:
+            return coords, None
+        segment = np.arange(points - 1, dtype=np.uint32)
+        segment = np.stack((segment, segment + 1), axis=1)
+        base = np.arange(lines, dtype=np.uint32)[:, None, None] * np.uint32(points)
+        return coords, (base + segment).reshape(-1, 2)
+
+    coords = []
+    indices = []
+    for line in polylines:
+        count = len(line)
+        if count < 2:
+            continue
+        start = np.arange(len(coords), len(coords) + count - 1, dtype=np.uint32)
+        indices.append(np.stack((start, start + 1), axis=1))
+        coords.extend(line)
+
+    if not indices:
+        return coords, None
+    return coords, np.concatenate(indices)
+
+
+def transform_coords_2d(coords, mat: Matrix) -> np.ndarray:
+    """Transform 2d coordinates on the XY plane by a 4x4 matrix.
+
+    Returns an (N, 3) float32 array which can be passed to batch_from_arrays directly.
+    """
+    # mathutils matrices are single precision, so is the result
+    co = np.asarray(coords, dtype=np.float32).reshape(-1, 2)
+    m = np.array(mat, dtype=np.float32)
+    # Write straight into the float32 result instead of casting a temporary
+    out = np.empty((len(co), 3), dtype=np.float32)
+    np.matmul(co, m[:3, :2].T, out=out)
+    out += m[:3, 3]
+    return out
+
+
+def draw_rect_3d(
+    origin: Vector, orientation: Vector, width: float
+) -> List[List[float]]:
     mat_rot = global_data.Z_AXIS.rotation_difference(orientation).to_matrix()
     mat = Matrix.Translation(origin) @ mat_rot.to_4x4()
-    coords = draw_rect_2d(0, 0, width, width)
-    coords = [(mat @ Vector(co))[:] for co in coords]
-    return coords
+    # Transform all homogeneous corners with a single matmul
+    corners = np.ones((4, 4), dtype=np.float32)
+    corners[:, :3] = draw_rect_2d(0, 0, width, width)
+    coords = corners @ np.array(mat, dtype=np.float32).T
+    return coords[:, :3].tolist()
 
 
 def draw_quad_3d(cx: float, cy: float, cz: float, width: float):
@@ -38,85 +123,118 @@ def draw_quad_3d(cx: float, cy: float, cz: float, width: float):
         (cx + half_width, cy + half_width, cz),
         (cx - half_width, cy + half_width, cz),
     )
-    indices = ((0, 1, 2), (2, 3, 0))
-    return coords, indices
+    return coords, QUAD_INDICES
 
 
-def draw_billboard_quad_3d(cx: float, cy: float, cz: float, width: float):
-    """Create a screen-facing quad that always appears as a square regardless of view angle."""
-    half_width = width / 2
-    center = Vector((cx, cy, cz))
-
-    # Get current view matrix to determine camera orientation
-    context = bpy.context
-    if hasattr(context, 'region_data') and context.region_data:
-        # Get the view matrix to determine camera orientation
-        view_matrix = context.region_data.view_matrix
-
-        # Extract camera right and up vectors from the view matrix
-        # The view matrix transforms from world to view space
-        # So we need the inverse to get world space vectors
-        view_matrix_inv = view_matrix.inverted()
-
-        # Camera right vector (X axis in view space)
-        right = Vector((view_matrix_inv[0][0], view_matrix_inv[1][0], view_matrix_inv[2][0])).normalized()
-        # Camera up vector (Y axis in view space)
-        up = Vector((view_matrix_inv[0][1], view_matrix_inv[1][1], view_matrix_inv[2][1])).normalized()
-    else:
-        # Fallback to XY plane if no context
-        right = Vector((1, 0, 0))
-        up = Vector((0, 1, 0))
-
-    # Create quad vertices using camera-relative vectors
-    coords = (
-        center - right * half_width - up * half_width,  # Bottom-left
-        center + right * half_width - up * half_width,  # Bottom-right
-        center + right * half_width + up * half_width,  # Top-right
-        center - right * half_width + up * half_width,  # Top-left
-    )
+def tris_from_quad_ids(id0: int, id1: int, id2: int, id3: int):
+    return (id0, id1, id2), (id1, id2, id3)
 
-    # Convert to tuples for GPU batch
-    coords = [co[:] for co in coords]
-    indices = ((0, 1, 2), (2, 3, 0))
 
-    return coords, indices
+def _read_only(array: np.ndarray) -> np.ndarray:
+    array.flags.writeable = False
+    return array
 
 
-def tris_from_quad_ids(id0: int, id1: int, id2: int, id3: int):
-    return (id0, id1, id2), (id1, id2, id3)
+# Index arrays are shared between all calls, copy them before modifying
+QUAD_INDICES = _read_only(np.array(((0, 1, 2), (2, 3, 0)), dtype=np.uint32))
 
+# Cube corner order: ((-x, -y, -z), (-x, -y, +z), (-x, +y, -z), ...)
+_CUBE_UNIT = _read_only(
+    np.array(
+        [(x, y, z) for x in (-1, 1) for y in (-1, 1) for z in (-1, 1)],
+        dtype=np.float32,
+    )
+)
 
-def draw_cube_3d(cx: float, cy: float, cz: float, width: float):
-    half_width = width / 2
-    coords = []
-    for x in (cx - half_width, cx + half_width):
-        for y in (cy - half_width, cy + half_width):
-            for z in (cz - half_width, cz + half_width):
-                coords.append((x, y, z))
-    # order: ((-x, -y, -z), (-x, -y, +z), (-x, +y, -z), ...)
-    indices = (
-        *tris_from_quad_ids(0, 1, 2, 3),
-        *tris_from_quad_ids(0, 1, 4, 5),
-        *tris_from_quad_ids(1, 3, 5, 7),
-        *tris_from_quad_ids(2, 3, 6, 7),
-        *tris_from_quad_ids(0, 2, 4, 6),
-        *tris_from_quad_ids(4, 5, 6, 7),
+# Two triangles per face, as tris_from_quad_ids() would return them
+CUBE_INDICES = _read_only(
+    np.array(
+        (
+            (0, 1, 2),
+            (1, 2, 3),
+            (0, 1, 4),
+            (1, 4, 5),
+            (1, 3, 5),
+            (3, 5, 7),
+            (2, 3, 6),
+            (3, 6, 7),
+            (0, 2, 4),
+            (2, 4, 6),
+            (4, 5, 6),
+            (5, 6, 7),
+        ),
+        dtype=np.uint32,
     )
+)
 
-    return coords, indices
 
+def draw_cube_3d(cx: float, cy: float, cz: float, width: float):
+    coords = _CUBE_UNIT * np.float32(width / 2)
+    coords += np.array((cx, cy, cz), dtype=np.float32)
+    return coords, CUBE_INDICES
+
+
+@lru_cache(maxsize=64)
+def _unit_arc(segments: int, angle: float, offset: float) -> np.ndarray:
+    """Points of an arc on the unit circle as a read-only (segments + 1, 2) array.
+
+    Arcs are regenerated whenever an entity gets updated, mostly with the
+    same segment count and angles, e.g. full circles, cache the trigonometry.
+    """
+    if angle == FULL_TURN and offset == 0.0 and segments % 4 == 0:
+        return _unit_circle(segments)
+
+    angles = np.arange(segments + 1) * ((1.0 / segments) * angle) + offset
+    points = np.empty((segments + 1, 2))
+    np.cos(angles, out=points[:, 0])
+    np.sin(angles, out=points[:, 1])
+    points.flags.writeable = False
+    return points
+
+
+# Per quadrant: sign of cos, cos uses the mirrored index, sign of sin
+_QUADRANTS = np.array(((1, 0, 1), (-1, 1, 1), (-1, 0, -1), (1, 1, -1)))
 
-def coords_circle_2d(x: float, y: float, radius: float, segments: int):
-    coords = []
-    m = (1.0 / (segments - 1)) * FULL_TURN
 
-    for p in range(segments):
-        p1 = x + cos(m * p) * radius
-        p2 = y + sin(m * p) * radius
-        coords.append((p1, p2))
+@lru_cache(maxsize=16)
+def _quarter_cos(quarter: int) -> np.ndarray:
+    return np.cos(np.linspace(0.0, QUARTER_TURN, quarter + 1))
+
+
+def _unit_circle(segments: int) -> np.ndarray:
+    """Full unit circle derived from a quarter cosine table by symmetry,
+    segments has to be a multiple of four"""
+    quarter = segments // 4
+    table = _quarter_cos(quarter)
+
+    k = np.arange(segments + 1)
+    quadrant = _QUADRANTS[(k // quarter) % 4]
+    r = k % quarter
+    mirrored = quarter - r
+
+    # sin(x) = cos(QUARTER_TURN - x) within the first quadrant
+    cos_idx = np.where(quadrant[:, 1] == 1, mirrored, r)
+    sin_idx = np.where(quadrant[:, 1] == 1, r, mirrored)
+
+    points = np.empty((segments + 1, 2))
+    points[:, 0] = quadrant[:, 0] * table[cos_idx]
+    points[:, 1] = quadrant[:, 2] * table[sin_idx]
+    points.flags.writeable = False
+    return points
+
+
+def _scale_unit_arc(points: np.ndarray, x: float, y: float, radius: float) -> np.ndarray:
+    """Scale and offset unit arc points into a new (N, 2) float32 array"""
+    coords = np.empty(points.shape, dtype=np.float32)
+    np.multiply(points, radius, out=coords)
+    coords += (x, y)
     return coords
 
 
+def coords_circle_2d(x: float, y: float, radius: float, segments: int) -> np.ndarray:
+    return _scale_unit_arc(_unit_arc(segments - 1, FULL_TURN, 0.0), x, y, radius)
+
+
 def coords_arc_2d(
     x: float,
     y: float,
@@ -126,20 +244,24 @@ def coords_arc_2d(
     offset: float = 0.0,
     type="LINE_STRIP",
 ):
-    coords = deque()
     segments = max(segments, 1)
 
-    m = (1.0 / segments) * angle
-
-    prev_point = None
-    for p in range(segments + 1):
-        co_x = x + cos(m * p + offset) * radius
-        co_y = y + sin(m * p + offset) * radius
-        if type == "LINES":
-            if prev_point:
-                coords.append(prev_point)
-                coords.append((co_x, co_y))
-            prev_point = co_x, co_y
-        else:
-            coords.append((co_x, co_y))
-    return coords
+    # Degenerate arcs collapse to one segment, valid for both LINES and LINE_STRIP
+    # The radius is signed, e.g. for angle gizmos on the opposite side
+    if abs(radius) < RenderingConstants.MIN_ARC_RADIUS:
+        return np.array(((x, y), (x, y)), dtype=np.float32)
+    if abs(angle) < RenderingConstants.MIN_ARC_ANGLE:
+        angles = np.array((offset, offset + angle))
+        return _scale_unit_arc(
+            np.stack((np.cos(angles), np.sin(angles)), axis=1), x, y, radius
+        )
+
+    points = _scale_unit_arc(_unit_arc(segments, angle, offset), x, y, radius)
+
+    if type == "LINES":
+        # Every inner point ends one segment and starts the next
+        idx = np.empty(2 * segments, dtype=np.intp)
+        idx[0::2] = np.arange(segments)
+        idx[1::2] = np.arange(1, segments + 1)
+        return points[idx]
+    return points
@@ -9,8 +9,10 @@ and prevent resource leaks.
 import logging
 import time
 import gpu
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
+from .. import global_data
+from ..shaders import Shaders
 from .constants import RenderingConstants
 
 logger = logging.getLogger(__name__)
@@ -20,8 +22,16 @@ class ShaderManager:
     """Centralized shader management with caching and lifecycle control."""
 
     _cached_shaders: Dict[str, gpu.types.GPUShader] = {}
+    _dependent_caches: List[dict] = []
     _last_cleanup_time: float = 0.0
 
+    @classmethod
+    def register_dependent_cache(cls, cache: dict) -> dict:
+        """Register a cache holding shaders from this manager or objects created
+        for them, the cache is cleared together with the shader cache."""
+        cls._dependent_caches.append(cache)
+        return cache
+
     @classmethod
     def get_uniform_color_shader(cls) -> gpu.types.GPUShader:
         """Get cached uniform color shader for points and solid rendering."""
@@ -49,11 +59,22 @@ class ShaderManager:
                 raise
         return cls._cached_shaders[shader_key]
 
+    @classmethod
+    def get_billboard_shader(cls) -> gpu.types.GPUShader:
+        """Get cached shader expanding points to camera facing quads."""
+        shader_key = 'billboard_point'
+        if shader_key not in cls._cached_shaders:
+            try:
+                cls._cached_shaders[shader_key] = Shaders.billboard_point_3d()
+                logger.debug(f"Created shader: {shader_key}")
+            except Exception as e:
+                logger.error(f"Failed to create billboard shader: {e}")
+                raise
+        return cls._cached_shaders[shader_key]
+
     @classmethod
     def get_id_shader(cls, is_point: bool = False) -> gpu.types.GPUShader:
         """Get cached ID shader for selection rendering."""
-        from ..shaders import Shaders
-
         # Use single consolidated shader for both points and lines
         shader_key = 'id_shader'
         if shader_key not in cls._cached_shaders:
@@ -86,6 +107,8 @@ class ShaderManager:
             # Force cleanup - clear all cached shaders
             count = len(cls._cached_shaders)
             cls._cached_shaders.clear()
+            for cache in cls._dependent_caches:
+                cache.clear()
             cls._last_cleanup_time = current_time
             logger.debug(f"Force cleaned up {count} cached shaders")
             return count
@@ -131,7 +154,6 @@ class GPUResourceManager:
 
         # Clean up unused batches
         try:
-            from .. import global_data
             if hasattr(global_data, 'cleanup_unused_batches'):
                 global_data.cleanup_unused_batches(context)
                 # We don't get a count back, but we attempted cleanup
@@ -153,7 +175,6 @@ class GPUResourceManager:
         }
 
         try:
-            from .. import global_data
             if hasattr(global_data, 'cleanup_unused_batches'):
                 global_data.cleanup_unused_batches(context)
                 stats['cleaned_batches'] = -1
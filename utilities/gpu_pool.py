@@ -0,0 +1,57 @@
+"""
+Pool of GPU batches shared between entities
+
+Blender doesn't allow to refill the vertex buffer of a batch once it has been
+uploaded, so instead of recycling buffers, batches are shared by their content.
+Only geometry that actually repeats is pooled, e.g. workplane borders which are
+defined in local space and are identical for all workplanes of the same size.
+
+Batches are reference counted, every acquire() has to be paired with a
+release() once the entity replaces or drops its batch. A batch is dropped as
+soon as no entity uses it anymore, so the pool never holds more batches than
+there are live entities using it.
+"""
+
+import numpy as np
+
+from .draw import batch_from_arrays, pack_coords
+
+# Maps (shader, batch type, coords, indices) -> [batch, user count]
+_pool = {}
+
+
+def make_key(shader, batch_type: str, coords: np.ndarray, indices=None):
+    """Key of a batch, coords are expected to be packed already"""
+    return (
+        shader,
+        batch_type,
+        coords.tobytes(),
+        None if indices is None else np.asarray(indices, dtype=np.int32).tobytes(),
+    )
+
+
+def acquire(shader, batch_type: str, coords, indices=None, key=None):
+    """Get a batch for the given geometry, creates it when not pooled yet"""
+    coords = pack_coords(coords)
+    if key is None:
+        key = make_key(shader, batch_type, coords, indices)
+
+    entry = _pool.get(key)
+    if entry is None:
+        entry = _pool[key] = [batch_from_arrays(shader, batch_type, coords, indices), 0]
+    entry[1] += 1
+    return entry[0]
+
+
+def release(key):
+    """Release a batch acquired with the given key"""
+    entry = _pool.get(key)
+    if entry is None:
+        return
+    entry[1] -= 1
+    if entry[1] <= 0:
+        del _pool[key]
+
+
+def clear():
+    _pool.clear()
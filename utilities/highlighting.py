@@ -39,7 +39,7 @@ class HighlightElement:
 
         # Clear previous highlights
         global_data.highlight_constraint = None
-        global_data.highlight_entities = []
+        global_data.highlight_entities.clear()
 
         index = properties.index
         members = properties.highlight_members
@@ -50,14 +50,18 @@ class HighlightElement:
 
             global_data.highlight_constraint = c
             if members:
-                global_data.highlight_entities.extend(c.entities())
+                global_data.highlight_entities.update(
+                    e.slvs_index for e in c.entities() if e
+                )
 
         else:
             # Set hover so this could be used as selection
             global_data.hover = properties.index
             if members:
                 e = context.scene.sketcher.entities.get(index)
-                global_data.highlight_entities.extend(e.dependencies())
+                global_data.highlight_entities.update(
+                    dep.slvs_index for dep in e.dependencies() if dep
+                )
 
         context.area.tag_redraw()
         return cls.__doc__
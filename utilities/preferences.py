@@ -7,10 +7,29 @@ def get_prefs():
     return bpy.context.preferences.addons[get_name()].preferences
 
 
+# Entity scale cached for the duration of a draw callback, see cache_scale()
+_cached_scale = None
+
+
 def get_scale():
+    if _cached_scale is not None:
+        return _cached_scale
     return bpy.context.preferences.system.ui_scale * get_prefs().entity_scale
 
 
+def cache_scale():
+    """Cache the entity scale until clear_scale_cache() is called, avoids
+    reading the preferences for every entity that gets drawn"""
+    global _cached_scale
+    _cached_scale = None
+    _cached_scale = get_scale()
+
+
+def clear_scale_cache():
+    global _cached_scale
+    _cached_scale = None
+
+
 def is_experimental():
     return get_prefs().show_debug_settings
 
@@ -0,0 +1,181 @@
+"""
+Instanced rendering of workplane surfaces
+
+All workplanes share the same surface quad, instead of issuing one draw call
+per workplane the surfaces are collected while drawing the workplanes and
+drawn with a single instanced draw call before the next other entity.
+"""
+
+import logging
+
+import gpu
+import numpy as np
+from mathutils import Matrix
+
+from ..shaders import Shaders
+from .constants import RenderingConstants
+from .draw import batch_from_arrays, draw_rect_2d, pack_coords
+from .gpu_manager import ShaderManager
+
+logger = logging.getLogger(__name__)
+
+# Surface quad of a workplane in local space, shared with the workplane entity
+SURFACE_INDICES = np.array(((0, 1, 2), (0, 2, 3)), dtype=np.uint32)
+
+# The selection surface is drawn both slightly behind and in front of the
+# outline for maximum selectability
+_ID_SURFACE_OFFSET = np.array((0.0, 0.0, 0.0001), dtype=np.float32)
+
+
+class WorkplaneGeometry:
+    """Geometry of all workplanes of a given size in local space, the batches
+    are created on first use. All batches only hold positions and can be drawn
+    with any of the shaders used for workplanes."""
+
+    def __init__(self, size: float):
+        self.coords = pack_coords(draw_rect_2d(0, 0, size, size))
+        self._surface = None
+        self._id_surface = None
+
+    @property
+    def surface(self):
+        if self._surface is None:
+            self._surface = batch_from_arrays(
+                ShaderManager.get_uniform_color_shader(),
+                "TRIS",
+                self.coords,
+                SURFACE_INDICES,
+            )
+        return self._surface
+
+    @property
+    def id_surface(self):
+        """Both selection quads merged into a single batch"""
+        if self._id_surface is None:
+            coords = np.concatenate(
+                (self.coords - _ID_SURFACE_OFFSET, self.coords + _ID_SURFACE_OFFSET)
+            )
+            indices = np.concatenate((SURFACE_INDICES, SURFACE_INDICES + 4))
+            self._id_surface = batch_from_arrays(
+                ShaderManager.get_id_shader(), "TRIS", coords, indices
+            )
+        return self._id_surface
+
+
+# Maps workplane size -> WorkplaneGeometry
+_geometry = {}
+
+
+def get_geometry(size: float) -> WorkplaneGeometry:
+    geometry = _geometry.get(size)
+    if geometry is None:
+        geometry = _geometry[size] = WorkplaneGeometry(size)
+    return geometry
+
+
+def clear_geometry():
+    """Drop cached workplane geometry, e.g. after the workplane size changed"""
+    _geometry.clear()
+
+
+class WorkplaneRenderer:
+    """Collects visible workplane surfaces per frame and draws them at once."""
+
+    _queue = []
+    _shader = None
+    _ubo = None
+    _ubo_data = None
+    _instancing_available = True
+
+    @classmethod
+    def enqueue(cls, size: float, matrix: Matrix, color):
+        """Queue a surface of the given size, matrix maps it to world space"""
+        cls._queue.append((size, matrix, color))
+
+    @classmethod
+    def has_pending(cls) -> bool:
+        return bool(cls._queue)
+
+    @classmethod
+    def _get_shader(cls):
+        if cls._shader is None and cls._instancing_available:
+            try:
+                cls._shader = Shaders.instanced_surface_3d(
+                    RenderingConstants.MAX_WORKPLANE_INSTANCES
+                )
+            except Exception as e:
+                logger.warning(f"Instanced workplane rendering unavailable: {e}")
+                cls._instancing_available = False
+        return cls._shader
+
+    @classmethod
+    def _get_ubo_data(cls, max_instances):
+        """Scratch arrays for the uniform block, allocated once and reused every frame"""
+        if cls._ubo_data is None:
+            # std140 layout, all model matrices followed by all colors
+            data = np.zeros(max_instances * 20, dtype=np.float32)
+            models = data[: max_instances * 16].reshape(max_instances, 4, 4)
+            colors = data[max_instances * 16 :].reshape(max_instances, 4)
+            cls._ubo_data = (data, models, colors)
+        return cls._ubo_data
+
+    @classmethod
+    def flush(cls):
+        """Draw all queued surfaces and empty the queue"""
+        queue, cls._queue = cls._queue, []
+        if not queue:
+            return
+
+        gpu.state.blend_set("ALPHA")
+        shader = cls._get_shader()
+        if shader is None:
+            cls._draw_fallback(queue)
+        else:
+            cls._draw_instanced(shader, queue)
+        gpu.shader.unbind()
+        gpu.state.blend_set("NONE")
+
+    @classmethod
+    def _draw_instanced(cls, shader, queue):
+        max_instances = RenderingConstants.MAX_WORKPLANE_INSTANCES
+        view_projection = (
+            gpu.matrix.get_projection_matrix() @ gpu.matrix.get_model_view_matrix()
+        )
+
+        by_size = {}
+        for size, matrix, color in queue:
+            by_size.setdefault(size, []).append((matrix, color))
+
+        data, models, colors = cls._get_ubo_data(max_instances)
+
+        shader.bind()
+        shader.uniform_float("ViewProjectionMatrix", view_projection)
+
+        for size, instances in by_size.items():
+            batch = get_geometry(size).surface
+            for start in range(0, len(instances), max_instances):
+                chunk = instances[start : start + max_instances]
+
+                # mat4 arrays are stored column major, slots past the chunk
+                # keep stale data but are never read by the drawn instances
+                for i, (matrix, color) in enumerate(chunk):
+                    models[i] = np.array(matrix, dtype=np.float32).T
+                    colors[i] = color
+
+                if cls._ubo is None:
+                    cls._ubo = gpu.types.GPUUniformBuf(data)
+                else:
+                    cls._ubo.update(data)
+
+                shader.uniform_block("instances", cls._ubo)
+                batch.draw_instanced(shader, instance_count=len(chunk))
+
+    @classmethod
+    def _draw_fallback(cls, queue):
+        shader = ShaderManager.get_uniform_color_shader()
+        shader.bind()
+        for size, matrix, color in queue:
+            with gpu.matrix.push_pop():
+                gpu.matrix.multiply_matrix(matrix)
+                shader.uniform_float("color", color)
+                get_geometry(size).surface.draw(shader)